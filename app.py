@@ -21,7 +21,8 @@ def main():
     st.title("🩺 F–M–B Medical Communication Operation Console")
     st.caption("Free-form Data → Front(Memory) → Middle(Constraints) → Optimizer(Decision) → API → Back(Selective RIS/AI-RAN) → KOI & Effect Mapping")
 
-    render_top_status_bar()
+    # 상태 바 자리는 먼저 잡고, 탭에서 intake 처리가 끝난 뒤에 채움(이번 run의 결과 반영)
+    status_bar = st.container()
 
     tabs = st.tabs(["1) Live Intake", "2) F–M–B Pipeline", "3) API Console", "4) Results & Effect Mapping"])
     with tabs[0]:
@@ -33,5 +34,8 @@ def main():
     with tabs[3]:
         tab_results_effects()
 
+    with status_bar:
+        render_top_status_bar()
+
 if __name__ == "__main__":
     main()
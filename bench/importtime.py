@@ -0,0 +1,80 @@
+"""
+Cold-start import benchmark (`python -X importtime` 기반).
+
+    python bench/importtime.py            # worker / console 비교
+    python bench/importtime.py --check    # worker가 streamlit/pandas/numpy를 끌어오면 exit 1
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    "worker": "import src.worker",
+    "console": "import src.ui",
+}
+HEAVY = ("streamlit", "pandas", "numpy")
+
+def _importtime(stmt: str) -> Tuple[int, Dict[str, int], Set[str]]:
+    # stderr 형식: "import time: self [us] | cumulative | imported package"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else f"failed: {stmt}")
+    total = 0
+    top: Dict[str, int] = {}
+    roots: Set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        total += int(self_us)
+        roots.add(name.strip().split(".")[0])
+        if not name[1:].startswith(" "):  # 들여쓰기 없음 = 최상위 import
+            top[name.strip()] = int(cum_us)
+    return total, top, roots
+
+def measure(stmt: str, runs: int) -> Dict[str, object]:
+    totals: List[int] = []
+    top: Dict[str, int] = {}
+    roots: Set[str] = set()
+    for _ in range(runs):
+        total, top, roots = _importtime(stmt)
+        totals.append(total)
+    heaviest = sorted(top.items(), key=lambda kv: kv[1], reverse=True)[:8]
+    return {
+        "median_ms": round(statistics.median(totals) / 1000.0, 1),
+        "min_ms": round(min(totals) / 1000.0, 1),
+        "heavy_loaded": [m for m in HEAVY if m in roots],
+        "top_ms": {k: round(v / 1000.0, 1) for k, v in heaviest},
+    }
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--check", action="store_true")
+    args = ap.parse_args()
+
+    report: Dict[str, object] = {}
+    for name, stmt in TARGETS.items():
+        try:
+            report[name] = measure(stmt, args.runs)
+        except RuntimeError as e:
+            report[name] = {"error": str(e)}
+    print(json.dumps(report, indent=2))
+
+    worker = report["worker"]
+    if args.check and (not isinstance(worker, dict) or "error" in worker or worker["heavy_loaded"]):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
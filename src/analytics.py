@@ -0,0 +1,188 @@
+from __future__ import annotations
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .back import Telemetry
+from .metrics import KOI
+from .optimizer import Decision
+
+KPI_FIELDS = ("latency_ms", "loss_pct", "jitter_ms")
+KOI_FIELDS = ("koi_mission", "koi_cost", "koi_stability")
+GROUP_FIELDS = ("slice", "ris", "ai_ran")
+
+# (bucket 크기 sec, 보관 bucket 수): 분 단위 1시간 + 시간 단위 1일
+DEFAULT_TIERS: Tuple[Tuple[int, int], ...] = ((60, 60), (3600, 24))
+
+class QuantileSketch:
+    """
+    DDSketch 스타일 로그 버킷 quantile sketch(상대 오차 rel_acc).
+    메모리/질의 비용은 값의 범위에만 비례(관측 개수와 무관), merge 가능.
+    """
+    __slots__ = ("rel_acc", "_log_gamma", "bins", "zero", "count", "total", "min", "max")
+
+    def __init__(self, rel_acc: float = 0.01):
+        self.rel_acc = rel_acc
+        self._log_gamma = math.log((1 + rel_acc) / (1 - rel_acc))
+        self.bins: Dict[int, int] = {}
+        self.zero = 0  # 0 이하 값
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        self.total += x
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        if x <= 0:
+            self.zero += 1
+            return
+        k = math.ceil(math.log(x) / self._log_gamma)
+        self.bins[k] = self.bins.get(k, 0) + 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.zero += other.zero
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for k, n in other.bins.items():
+            self.bins[k] = self.bins.get(k, 0) + n
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero
+        if rank < seen:
+            return 0.0
+        k = max(self.bins)
+        for k in sorted(self.bins):
+            seen += self.bins[k]
+            if rank < seen:
+                break
+        # 버킷 (gamma^(k-1), gamma^k] 의 대표값, 관측 min/max 범위로 clamp
+        v = 2 * math.exp(k * self._log_gamma) / (1 + math.exp(self._log_gamma))
+        return min(self.max, max(self.min, v))
+
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+class _Rollup:
+    __slots__ = ("count", "sketches", "koi_sum")
+
+    def __init__(self, rel_acc: float):
+        self.count = 0
+        self.sketches = {f: QuantileSketch(rel_acc) for f in KPI_FIELDS}
+        self.koi_sum = {f: 0.0 for f in KOI_FIELDS}
+
+    def add(self, kpi: Dict[str, float], koi: Dict[str, float]) -> None:
+        self.count += 1
+        for f in KPI_FIELDS:
+            self.sketches[f].add(kpi[f])
+        for f in KOI_FIELDS:
+            self.koi_sum[f] += koi[f]
+
+    def merge(self, other: "_Rollup") -> None:
+        self.count += other.count
+        for f in KPI_FIELDS:
+            self.sketches[f].merge(other.sketches[f])
+        for f in KOI_FIELDS:
+            self.koi_sum[f] += other.koi_sum[f]
+
+    def summary(self) -> Dict[str, float]:
+        row: Dict[str, float] = {"count": self.count}
+        for f in KPI_FIELDS:
+            sk = self.sketches[f]
+            for q in (50, 95, 99):
+                v = sk.quantile(q / 100.0)
+                row[f"{f}_p{q}"] = round(v, 2) if v is not None else float("nan")
+        for f in KOI_FIELDS:
+            row[f"{f}_mean"] = round(self.koi_sum[f] / self.count, 1) if self.count else float("nan")
+        return row
+
+GroupKey = Tuple[str, str, str]  # (slice, ris, ai_ran)
+
+class RollingAnalytics:
+    """
+    ✅ Telemetry/KOI 결과를 incremental하게 집계하는 rolling analytics
+    - tier별 tumbling window(기본: 1분 x 60, 1시간 x 24)에 (slice, ris, ai_ran) 그룹별 rollup 유지
+    - query/series는 보관 bucket 수 × 그룹 수에만 비례 → 누적 이력 길이와 무관
+    - series는 bucket당 한 점으로 downsample된 차트용 데이터
+    """
+    def __init__(self, tiers: Tuple[Tuple[int, int], ...] = DEFAULT_TIERS,
+                 rel_acc: float = 0.01, clock: Callable[[], float] = time.time):
+        self.tiers = tiers
+        self.rel_acc = rel_acc
+        self._clock = clock
+        # tier별: bucket_start → {group_key → _Rollup}
+        self._buckets: List["OrderedDict[int, Dict[GroupKey, _Rollup]]"] = [OrderedDict() for _ in tiers]
+        self.total = 0
+
+    def ingest(self, tele: Telemetry, koi: KOI, decision: Decision, ts: Optional[float] = None) -> None:
+        ts = self._clock() if ts is None else ts
+        key: GroupKey = (decision.slice_id, "ON" if decision.ris_active else "OFF", decision.ai_ran_mode)
+        kpi = {"latency_ms": tele.latency_ms, "loss_pct": tele.loss_pct, "jitter_ms": tele.jitter_ms}
+        kv = {"koi_mission": koi.mission_success, "koi_cost": koi.operational_cost, "koi_stability": koi.stability}
+        self.total += 1
+        for (size, keep), buckets in zip(self.tiers, self._buckets):
+            start = int(ts // size) * size
+            groups = buckets.get(start)
+            if groups is None:
+                groups = buckets[start] = {}
+                # 보관 범위를 벗어난 오래된 bucket 제거
+                while buckets and next(iter(buckets)) <= start - size * keep:
+                    buckets.popitem(last=False)
+            rollup = groups.get(key)
+            if rollup is None:
+                rollup = groups[key] = _Rollup(self.rel_acc)
+            rollup.add(kpi, kv)
+
+    def _tier_for(self, window_sec: int) -> int:
+        for i, (size, keep) in enumerate(self.tiers):
+            if window_sec <= size * keep:
+                return i
+        return len(self.tiers) - 1
+
+    def _window(self, window_sec: int, now: Optional[float]):
+        i = self._tier_for(window_sec)
+        size, _ = self.tiers[i]
+        now = self._clock() if now is None else now
+        lo = int(now // size) * size - window_sec + size
+        return [(start, groups) for start, groups in self._buckets[i].items() if lo <= start <= now]
+
+    def query(self, window_sec: int = 3600, group_by: Optional[str] = None,
+              now: Optional[float] = None) -> List[Dict[str, object]]:
+        # group_by: None | "slice" | "ris" | "ai_ran"
+        idx = GROUP_FIELDS.index(group_by) if group_by else None
+        merged: Dict[str, _Rollup] = {}
+        for _, groups in self._window(window_sec, now):
+            for key, rollup in groups.items():
+                g = key[idx] if idx is not None else "all"
+                acc = merged.get(g)
+                if acc is None:
+                    acc = merged[g] = _Rollup(self.rel_acc)
+                acc.merge(rollup)
+        return [{"group": g, **acc.summary()} for g, acc in sorted(merged.items())]
+
+    def series(self, window_sec: int = 3600, now: Optional[float] = None) -> List[Dict[str, object]]:
+        # 차트용: bucket당 한 점(p50/p95 + KOI 평균)
+        rows = []
+        for start, groups in self._window(window_sec, now):
+            acc = _Rollup(self.rel_acc)
+            for rollup in groups.values():
+                acc.merge(rollup)
+            s = acc.summary()
+            row: Dict[str, object] = {"t": time.strftime("%m-%d %H:%M", time.localtime(start)), "count": s["count"]}
+            for f in KPI_FIELDS:
+                row[f"{f}_p50"] = s[f"{f}_p50"]
+                row[f"{f}_p95"] = s[f"{f}_p95"]
+            for f in KOI_FIELDS:
+                row[f"{f}_mean"] = s[f"{f}_mean"]
+            rows.append(row)
+        return rows
@@ -11,8 +11,12 @@ class ApiCall:
     body: Dict[str, Any]
     response: Dict[str, Any]
 
+# "적용 시간" 연출 배율(headless worker/benchmark에서는 0으로 두고 sleep 생략)
+DELAY_SCALE = 1.0
+
 def post(path: str, body: Dict[str, Any], delay_ms: int = 250) -> ApiCall:
-    time.sleep(delay_ms / 1000.0)  # "적용 시간" 연출
+    if DELAY_SCALE > 0:
+        time.sleep(delay_ms * DELAY_SCALE / 1000.0)  # "적용 시간" 연출
     resp = {
         "request_id": f"req-{uuid.uuid4().hex[:8]}",
         "applied": True,
@@ -1,10 +1,18 @@
 from __future__ import annotations
 import re
+import time
 import uuid
 import random
-from collections import deque
-from typing import Any, Deque, Dict, List, Tuple
+import hashlib
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from .schema import RawIngest, StandardEvent, now_iso
+from .signals import SIGNAL_EXTRACTOR
+
+_RE_HR = re.compile(r"(\d+)bpm")
+_RE_SPO2 = re.compile(r"SpO2=(\d+)")
+_RE_NURSE_PATIENT = re.compile(r"NURSE_NOTE\[(\w+)\]")
 
 def fake_embedding(dim: int = 8) -> List[float]:
     # 실제 임베딩 대신 데모용(경량화 시각화 목적)
@@ -17,15 +25,16 @@ def estimate_sizes(payload: Any) -> Tuple[float, float]:
     packed_kb = max(0.05, raw_kb * 0.08)  # "벡터화/경량화" 연출
     return round(raw_kb, 2), round(packed_kb, 2)
 
-def normalize(raw: RawIngest, patient_id_default: str = "A") -> StandardEvent:
+def normalize(raw: RawIngest, patient_id_default: str = "A", embed: bool = True) -> StandardEvent:
     payload = raw.payload
     signals: List[str] = []
     patient_id = patient_id_default
 
     if raw.source == "wearable":
         # "ECG: 142bpm, SpO2=88%, noise=0.12"
-        m_hr = re.search(r"(\d+)bpm", str(payload))
-        m_spo2 = re.search(r"SpO2=(\d+)", str(payload))
+        txt = str(payload)
+        m_hr = _RE_HR.search(txt)
+        m_spo2 = _RE_SPO2.search(txt)
         hr = int(m_hr.group(1)) if m_hr else 90
         spo2 = int(m_spo2.group(1)) if m_spo2 else 97
         if hr >= 130:
@@ -35,14 +44,10 @@ def normalize(raw: RawIngest, patient_id_default: str = "A") -> StandardEvent:
 
     elif raw.source == "nurse_note":
         txt = str(payload)
-        if "청색증" in txt or "푸르" in txt:
-            signals.append("cyanosis_suspect")
-        if "호흡" in txt or "숨" in txt:
-            signals.append("dyspnea_suspect")
-        if "흉통" in txt:
-            signals.append("chest_pain_suspect")
+        # 키워드 규칙은 signals.py 테이블에서 한 번의 스캔으로 매칭
+        signals.extend(SIGNAL_EXTRACTOR.extract("nurse_note", txt))
         # NURSE_NOTE[A] 형태면 patient 추출
-        m = re.search(r"NURSE_NOTE\[(\w+)\]", txt)
+        m = _RE_NURSE_PATIENT.search(txt)
         if m:
             patient_id = m.group(1)
 
@@ -51,9 +56,7 @@ def normalize(raw: RawIngest, patient_id_default: str = "A") -> StandardEvent:
             patient_id = payload.get("patient", patient_id_default)
             if payload.get("fall_detected"):
                 signals.append("fall_detected")
-            loc = payload.get("location", "")
-            if "Corridor" in loc or "ER" in loc:
-                signals.append("in_motion_or_transfer")
+            signals.extend(SIGNAL_EXTRACTOR.extract("ambulance_app", str(payload.get("location", ""))))
 
     elif raw.source == "network":
         if isinstance(payload, dict):
@@ -84,7 +87,7 @@ def normalize(raw: RawIngest, patient_id_default: str = "A") -> StandardEvent:
         signal=signals,
         severity=round(severity, 2),
         confidence=confidence,
-        embedding=fake_embedding(8),
+        embedding=fake_embedding(8) if embed else [],  # 과부하 시 임베딩 생략
         payload_hint={"raw_size_kb": raw_kb, "packed_size_kb": packed_kb},
         ttl_sec=15 if severity >= 0.7 else 60,
     )
@@ -118,3 +121,101 @@ class FrontHierMemory:
             "avg_severity": round(sum(vals) / len(vals), 2),
             "emergency_rate": round((sum(emerg) / len(vals)) if vals else 0.0, 2),
         }
+
+
+def event_content_hash(ev: StandardEvent) -> str:
+    # event_id/시간/임베딩은 매번 달라지므로 "내용"만으로 해시(중복 판정용)
+    key = f"{ev.source}|{ev.patient_id}|{','.join(sorted(ev.signal))}|{ev.severity:.2f}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+@dataclass
+class _PatientWindow:
+    event: StandardEvent
+    opened: float
+    seen: Set[str] = field(default_factory=set)
+
+class FrontEventAggregator:
+    """
+    ✅ Middle 이전 단계의 환자별 window 집계/중복 제거
+    - window는 환자의 첫 이벤트 시각에 고정되고 window_sec 후 닫힘(계속 들어와도 연장되지 않음)
+    - window 안의 이벤트는 하나의 통합 이벤트로 병합(signal 합집합, severity/confidence 최대, ttl 최소)
+    - 내용 해시가 이미 본 것이거나 병합해도 변화가 없으면 downstream으로 보내지 않음(None)
+    - 첫 이벤트와 새 signal/severity 상승만 즉시 내보냄 → window가 닫히면 상태를 초기화하므로
+      이후 낮아진 severity(회복)도 새 window의 첫 이벤트로 전달됨
+    - 통합 이벤트의 source/embedding/payload_hint는 window 첫 이벤트 값을 유지
+      (다른 source가 signal을 추가해도 바뀌지 않음)
+    """
+    def __init__(self, window_sec: float = 2.0, clock: Callable[[], float] = time.monotonic):
+        self.window_sec = window_sec
+        self._clock = clock
+        # 열린 순서(= 만료 순서)로 유지 → 만료 처리는 앞에서부터 닫힌 것만 pop
+        self._windows: "OrderedDict[str, _PatientWindow]" = OrderedDict()
+        self.received = 0
+        self.forwarded = 0
+        self.deduped = 0
+        self.closed_windows = 0
+
+    def flush(self, now: Optional[float] = None) -> int:
+        """닫힌 window를 정리(통합 이벤트는 이미 downstream에 반영된 상태)하고 닫은 개수를 반환."""
+        now = self._clock() if now is None else now
+        closed = 0
+        while self._windows:
+            w = next(iter(self._windows.values()))
+            if now - w.opened < self.window_sec:
+                break
+            self._windows.popitem(last=False)
+            closed += 1
+        self.closed_windows += closed
+        return closed
+
+    def offer(self, ev: StandardEvent) -> Optional[StandardEvent]:
+        now = self._clock()
+        self.received += 1
+        self.flush(now)
+
+        h = event_content_hash(ev)
+        w = self._windows.get(ev.patient_id)
+        if w is None:
+            self._windows[ev.patient_id] = _PatientWindow(event=ev, opened=now, seen={h})
+            self.forwarded += 1
+            return ev
+
+        if h in w.seen:
+            self.deduped += 1
+            return None
+        w.seen.add(h)
+
+        cur = w.event
+        signals = cur.signal + [s for s in ev.signal if s not in cur.signal]
+        if len(signals) > 1 and "normal_observation" in signals:
+            signals = [s for s in signals if s != "normal_observation"]
+        severity = max(cur.severity, ev.severity)
+        if signals == cur.signal and severity <= cur.severity:
+            return None
+
+        w.event = replace(
+            cur,
+            signal=signals,
+            severity=severity,
+            confidence=max(cur.confidence, ev.confidence),
+            event_time=ev.event_time,
+            ttl_sec=min(cur.ttl_sec, ev.ttl_sec),
+        )
+        self.forwarded += 1
+        return w.event
+
+    def compression_ratio(self) -> float:
+        # 입력 이벤트 수 / downstream 전달 수 (1.0 = 압축 없음)
+        if self.forwarded == 0:
+            return 1.0
+        return round(self.received / self.forwarded, 2)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "received": float(self.received),
+            "forwarded": float(self.forwarded),
+            "deduped": float(self.deduped),
+            "open_windows": float(len(self._windows)),
+            "closed_windows": float(self.closed_windows),
+            "compression_ratio": self.compression_ratio(),
+        }
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Dict, Any, List
 import random
 
@@ -24,45 +24,57 @@ class Intent:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
-def build_context(ev: StandardEvent) -> str:
-    if ev.severity >= 0.82:
+@dataclass
+class MiddlePolicy:
+    """
+    Middle 임계값/제약 테이블(context별). replay에서 정책 variant 비교용으로 교체 가능.
+    """
+    critical_severity: float = 0.82
+    suspect_severity: float = 0.7
+    latency_budget_ms: Dict[str, int] = field(default_factory=lambda: {
+        "EMERGENCY_CRITICAL": 8, "EMERGENCY_SUSPECT": 12, "NORMAL_MONITORING": 40,
+    })
+    reliability_target: Dict[str, float] = field(default_factory=lambda: {
+        "EMERGENCY_CRITICAL": 0.99999, "EMERGENCY_SUSPECT": 0.9999, "NORMAL_MONITORING": 0.999,
+    })
+    penalty_weights: Dict[str, Dict[str, float]] = field(default_factory=lambda: {
+        "EMERGENCY_CRITICAL": {"latency": 0.55, "loss": 0.30, "cost": 0.15},
+        "EMERGENCY_SUSPECT": {"latency": 0.45, "loss": 0.30, "cost": 0.25},
+        "NORMAL_MONITORING": {"latency": 0.20, "loss": 0.20, "cost": 0.60},
+    })
+    uncertainty_range: Dict[str, List[float]] = field(default_factory=lambda: {
+        "EMERGENCY_CRITICAL": [0.65, 0.9], "EMERGENCY_SUSPECT": [0.45, 0.75], "NORMAL_MONITORING": [0.10, 0.35],
+    })
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+DEFAULT_MIDDLE_POLICY = MiddlePolicy()
+
+def build_context(ev: StandardEvent, policy: MiddlePolicy = DEFAULT_MIDDLE_POLICY) -> str:
+    if ev.severity >= policy.critical_severity:
         return "EMERGENCY_CRITICAL"
-    if ev.severity >= 0.7:
+    if ev.severity >= policy.suspect_severity:
         return "EMERGENCY_SUSPECT"
     return "NORMAL_MONITORING"
 
-def ml_generate_constraints(ev: StandardEvent) -> Constraints:
+def ml_generate_constraints(ev: StandardEvent, policy: MiddlePolicy = DEFAULT_MIDDLE_POLICY) -> Constraints:
     """
     ✅ ML 역할: 제약 파라미터(임계값/상하한/벌점 가중치) 생성/갱신
     ❌ ML이 자원 할당 결정을 내리면 안 됨
     """
-    context = build_context(ev)
-
-    if context == "EMERGENCY_CRITICAL":
-        latency = 8
-        reliab = 0.99999
-        w = {"latency": 0.55, "loss": 0.30, "cost": 0.15}
-        uncertainty = round(random.uniform(0.65, 0.9), 2)
-    elif context == "EMERGENCY_SUSPECT":
-        latency = 12
-        reliab = 0.9999
-        w = {"latency": 0.45, "loss": 0.30, "cost": 0.25}
-        uncertainty = round(random.uniform(0.45, 0.75), 2)
-    else:
-        latency = 40
-        reliab = 0.999
-        w = {"latency": 0.20, "loss": 0.20, "cost": 0.60}
-        uncertainty = round(random.uniform(0.10, 0.35), 2)
+    context = build_context(ev, policy)
+    lo, hi = policy.uncertainty_range[context]
 
     return Constraints(
-        latency_budget_ms=latency,
-        reliability_target=reliab,
-        penalty_weights=w,
-        uncertainty=uncertainty,
+        latency_budget_ms=policy.latency_budget_ms[context],
+        reliability_target=policy.reliability_target[context],
+        penalty_weights=dict(policy.penalty_weights[context]),
+        uncertainty=round(random.uniform(lo, hi), 2),
     )
 
-def make_intent(ev: StandardEvent) -> Intent:
-    context = build_context(ev)
+def make_intent(ev: StandardEvent, policy: MiddlePolicy = DEFAULT_MIDDLE_POLICY) -> Intent:
+    context = build_context(ev, policy)
     if context.startswith("EMERGENCY"):
         itype = "emergency_care"
     else:
@@ -15,7 +15,22 @@ class Decision:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
-def decide(intent: Intent, c: Constraints) -> Decision:
+@dataclass
+class OptimizerPolicy:
+    """
+    Optimizer 규칙 파라미터. replay에서 정책 variant 비교용으로 교체 가능.
+    """
+    ris_min_uncertainty: float = 0.6
+    ris_max_cost_weight: float = 0.25
+    suspect_slice: str = "URLLC"
+    suspect_ai_ran_mode: str = "Assist"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+DEFAULT_OPTIMIZER_POLICY = OptimizerPolicy()
+
+def decide(intent: Intent, c: Constraints, policy: OptimizerPolicy = DEFAULT_OPTIMIZER_POLICY) -> Decision:
     """
     ✅ 최종 결정 주체(규칙/최적화). ML은 제약만 제공.
     """
@@ -24,15 +39,15 @@ def decide(intent: Intent, c: Constraints) -> Decision:
         slice_id = "URLLC"
         ai_ran_mode = "Aggressive"
     elif intent.context == "EMERGENCY_SUSPECT":
-        slice_id = "URLLC"
-        ai_ran_mode = "Assist"
+        slice_id = policy.suspect_slice
+        ai_ran_mode = policy.suspect_ai_ran_mode
     else:
         slice_id = "eMBB"
         ai_ran_mode = "Baseline"
 
     # Selective RIS 트리거: uncertainty + cost-weight 균형(아주 단순)
     cost_weight = float(c.penalty_weights.get("cost", 0.3))
-    ris_active = (c.uncertainty >= 0.6) and (cost_weight <= 0.25)
+    ris_active = (c.uncertainty >= policy.ris_min_uncertainty) and (cost_weight <= policy.ris_max_cost_weight)
     ris_zone = "Zone_B3" if ris_active else "OFF"
 
     # 예상 효과(데모용)
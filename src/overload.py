@@ -0,0 +1,112 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple
+
+# 단계적 degradation(누적): 상위 레벨은 하위 레벨의 조치를 모두 포함
+DEGRADATION_LEVELS = ["FULL", "NO_EMBED", "SAMPLE_ROUTINE", "BATCH_API", "NO_UI"]
+FULL, NO_EMBED, SAMPLE_ROUTINE, BATCH_API, NO_UI = range(len(DEGRADATION_LEVELS))
+
+@dataclass
+class OverloadConfig:
+    # queue depth가 각 값 이상이면 level 1..4
+    queue_thresholds: Tuple[int, int, int, int] = (4, 8, 16, 32)
+    # stage별 EWMA 지연 예산(ms). 하나라도 넘으면 level +1
+    stage_budget_ms: Dict[str, float] = field(default_factory=lambda: {
+        "front": 20.0, "middle": 10.0, "api": 1000.0, "back": 20.0,
+    })
+    ewma_alpha: float = 0.3
+    idle_decay: float = 0.5           # queue가 비면 stage EWMA를 이 비율로 감쇠(새 이벤트가 없어도 회복)
+    recover_ratio: float = 0.5        # 내려올 때는 queue 임계값 * ratio 아래여야 함(hysteresis)
+    routine_sample_every: int = 5     # SAMPLE_ROUTINE 이상: NORMAL_MONITORING 5건 중 1건만 처리
+
+class OverloadController:
+    """
+    ✅ 과부하 감지 → 단계적 degradation → 부하가 줄면 자동 복구
+    - 입력: queue depth, stage별 처리 지연(EWMA)
+    - NO_EMBED: 임베딩 생략 / SAMPLE_ROUTINE: routine 이벤트 샘플링
+    - BATCH_API: routine 결정은 묶어서 마지막 것만 apply / NO_UI: 이벤트별 UI 갱신 중단
+    - 응급(EMERGENCY_*) context는 어떤 레벨에서도 항상 처리·즉시 apply
+    """
+    def __init__(self, config: OverloadConfig | None = None):
+        self.config = config or OverloadConfig()
+        self.level = FULL
+        self.queue_depth = 0
+        self.stage_ms: Dict[str, float] = {}
+        self.shed = 0
+        self._routine_seen = 0
+        # drain 한 번 동안의 최고 level/shed 수(drain이 끝나면 level은 복구되므로 UI에는 이 값을 표시)
+        self.peak_level = FULL
+        self._shed_at_start = 0
+        self.last_drain: Dict[str, Any] = {"peak_level": FULL, "peak_level_name": DEGRADATION_LEVELS[FULL], "shed": 0}
+
+    def _target_level(self, queue_ratio: float) -> int:
+        # hysteresis는 queue depth에만 적용, stage 지연은 예산 그대로 비교
+        level = sum(1 for t in self.config.queue_thresholds if self.queue_depth >= t * queue_ratio)
+        over = any(ms > self.config.stage_budget_ms.get(stage, float("inf")) for stage, ms in self.stage_ms.items())
+        return min(NO_UI, level + (1 if over else 0))
+
+    def _update(self) -> None:
+        up = self._target_level(1.0)
+        if up > self.level:
+            self.level = up
+        else:
+            # 복구는 hysteresis 기준(queue 임계값 * recover_ratio)으로만
+            self.level = min(self.level, self._target_level(self.config.recover_ratio))
+        self.peak_level = max(self.peak_level, self.level)
+
+    def begin_drain(self) -> None:
+        self.peak_level = self.level
+        self._shed_at_start = self.shed
+
+    def end_drain(self) -> None:
+        self.last_drain = {
+            "peak_level": self.peak_level,
+            "peak_level_name": DEGRADATION_LEVELS[self.peak_level],
+            "shed": self.shed - self._shed_at_start,
+        }
+
+    def observe_queue(self, depth: int) -> None:
+        self.queue_depth = depth
+        if depth == 0:
+            # EWMA는 이벤트가 와야만 갱신되므로 idle일 때 감쇠시켜 오래된 지연이 level을 붙잡지 않게 함
+            for stage in self.stage_ms:
+                self.stage_ms[stage] *= self.config.idle_decay
+        self._update()
+
+    def observe_stage(self, stage: str, ms: float) -> None:
+        a = self.config.ewma_alpha
+        prev = self.stage_ms.get(stage)
+        self.stage_ms[stage] = ms if prev is None else (a * ms + (1 - a) * prev)
+        self._update()
+
+    @property
+    def level_name(self) -> str:
+        return DEGRADATION_LEVELS[self.level]
+
+    def embed_enabled(self) -> bool:
+        return self.level < NO_EMBED
+
+    def admit(self, context: str) -> bool:
+        if context.startswith("EMERGENCY") or self.level < SAMPLE_ROUTINE:
+            return True
+        self._routine_seen += 1
+        if (self._routine_seen - 1) % max(1, self.config.routine_sample_every) == 0:
+            return True
+        self.shed += 1
+        return False
+
+    def batch_api(self, context: str) -> bool:
+        return self.level >= BATCH_API and not context.startswith("EMERGENCY")
+
+    def per_event_ui(self) -> bool:
+        return self.level < NO_UI
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "level": self.level,
+            "level_name": self.level_name,
+            "queue_depth": self.queue_depth,
+            "stage_ms": {k: round(v, 1) for k, v in self.stage_ms.items()},
+            "shed": self.shed,
+            "last_drain": dict(self.last_drain),
+        }
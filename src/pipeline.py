@@ -0,0 +1,118 @@
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional
+
+from .schema import RawIngest, StandardEvent
+from .front import normalize, FrontHierMemory, FrontEventAggregator
+from .middle import Constraints, Intent, build_context, make_intent, ml_generate_constraints
+from .optimizer import Decision, decide
+from .api_sim import ApiCall, apply_network, apply_ris, apply_ai_ran
+from .back import Telemetry, execute
+from .metrics import KOI, koi_from
+from .overload import OverloadController
+
+StageObserver = Callable[[str, float], None]
+
+@dataclass
+class PipelineResult:
+    ev: StandardEvent
+    intent: Intent
+    constraints: Constraints
+    decision: Decision
+    calls: List[ApiCall]
+    tele: Telemetry
+    koi: KOI
+
+def phase_of(intent: Intent) -> str:
+    if intent.context == "EMERGENCY_CRITICAL":
+        return "Emergency"
+    if intent.context == "EMERGENCY_SUSPECT":
+        return "Alert"
+    return "Normal"
+
+def apply_decision(decision: Decision, constraints: Constraints) -> List[ApiCall]:
+    # "API 호출" 연출
+    return [
+        apply_network({"slice_id": decision.slice_id, "latency_budget_ms": constraints.latency_budget_ms, "reliability": constraints.reliability_target}),
+        apply_ris({"active": decision.ris_active, "zone": decision.ris_zone}),
+        apply_ai_ran({"mode": decision.ai_ran_mode, "penalty_weights": constraints.penalty_weights}),
+    ]
+
+def _ms_since(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1000.0
+
+def run_pipeline(ev: StandardEvent, apply: bool = True, observe: Optional[StageObserver] = None) -> PipelineResult:
+    """
+    Middle → Optimizer → API → Back → KOI 체인(headless).
+    UI(streamlit/pandas) 없이 worker/replay에서도 그대로 사용.
+    apply=False면 API apply를 호출자에게 미룸(BATCH_API degradation).
+    """
+    t0 = time.perf_counter()
+    intent = make_intent(ev)
+    constraints = ml_generate_constraints(ev)
+    decision = decide(intent, constraints)
+    if observe:
+        observe("middle", _ms_since(t0))
+
+    calls: List[ApiCall] = []
+    if apply:
+        t0 = time.perf_counter()
+        calls = apply_decision(decision, constraints)
+        if observe:
+            observe("api", _ms_since(t0))
+
+    # Back 실행 & telemetry
+    t0 = time.perf_counter()
+    tele = execute(decision)
+
+    # KOI 점수
+    koi = koi_from(tele, decision, constraints, intent)
+    if observe:
+        observe("back", _ms_since(t0))
+    return PipelineResult(ev=ev, intent=intent, constraints=constraints, decision=decision, calls=calls, tele=tele, koi=koi)
+
+def drain(
+    queue: Deque[RawIngest],
+    front_mem: FrontHierMemory,
+    agg: FrontEventAggregator,
+    ctl: OverloadController,
+    on_event: Optional[Callable[[RawIngest, StandardEvent], None]] = None,
+    on_result: Optional[Callable[[PipelineResult], None]] = None,
+) -> List[PipelineResult]:
+    """
+    intake queue를 비우면서 OverloadController의 degradation level을 적용.
+    batch로 미뤄진 routine 결정은 drain 끝에 마지막 결정 하나만 apply.
+    """
+    results: List[PipelineResult] = []
+    deferred: Optional[PipelineResult] = None
+    ctl.begin_drain()
+    while queue:
+        ctl.observe_queue(len(queue))
+        raw = queue.popleft()
+
+        t0 = time.perf_counter()
+        ev = normalize(raw, embed=ctl.embed_enabled())
+        front_mem.push(ev)
+        if on_event:
+            on_event(raw, ev)
+        ev = agg.offer(ev)
+        ctl.observe_stage("front", _ms_since(t0))
+        if ev is None or not ctl.admit(build_context(ev)):
+            continue
+
+        batched = ctl.batch_api(build_context(ev))
+        res = run_pipeline(ev, apply=not batched, observe=ctl.observe_stage)
+        # 즉시 apply된(응급) 결정이 더 최신이면 밀린 routine 결정은 버림
+        deferred = res if batched else None
+        results.append(res)
+        if on_result:
+            on_result(res)
+
+    if deferred is not None:
+        t0 = time.perf_counter()
+        deferred.calls = apply_decision(deferred.decision, deferred.constraints)
+        ctl.observe_stage("api", _ms_since(t0))
+    ctl.observe_queue(0)
+    ctl.end_drain()
+    return results
@@ -0,0 +1,281 @@
+"""
+Offline what-if replay: 같은 StandardEvent 스트림을 여러 정책 variant로 병렬 재생해 비교.
+
+    python -m src.replay --events 1000000 --workers 8
+    python -m src.replay --record events.jsonl --events 10000        # 생성 스트림 저장
+    python -m src.replay --events-file events.jsonl --variants-file variants.json
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .schema import StandardEvent
+from .generators import gen_nurse_note, gen_wearable_spike, gen_ambulance_app, gen_network_degradation
+from .front import normalize
+from .middle import MiddlePolicy, make_intent, ml_generate_constraints
+from .optimizer import OptimizerPolicy, decide
+from .back import execute
+from .metrics import koi_from
+from .analytics import QuantileSketch
+
+CHUNK_SIZE = 50_000
+
+@dataclass
+class PolicyVariant:
+    name: str
+    middle: MiddlePolicy = field(default_factory=MiddlePolicy)
+    optimizer: OptimizerPolicy = field(default_factory=OptimizerPolicy)
+    # True면 직전에 적용한 설정과 payload가 같은 API 호출은 생략
+    apply_on_change: bool = False
+
+    @classmethod
+    def from_dict(cls, name: str, d: Dict[str, Any]) -> "PolicyVariant":
+        # 기본 정책 위에 override를 덮어씀(context별 dict는 지정한 key만 교체)
+        return cls(
+            name=name,
+            middle=_override(MiddlePolicy(), d.get("middle", {}), f"{name}.middle"),
+            optimizer=_override(OptimizerPolicy(), d.get("optimizer", {}), f"{name}.optimizer"),
+            apply_on_change=bool(d.get("apply_on_change", False)),
+        )
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(base)
+    for k, v in override.items():
+        out[k] = _deep_merge(out[k], v) if isinstance(out.get(k), dict) and isinstance(v, dict) else v
+    return out
+
+def _override(policy: Any, overrides: Dict[str, Any], where: str) -> Any:
+    known = {f.name for f in fields(policy)}
+    unknown = sorted(set(overrides) - known)
+    if unknown:
+        raise ValueError(f"{where}: unknown field(s) {', '.join(unknown)}")
+    changes = {}
+    for k, v in overrides.items():
+        cur = getattr(policy, k)
+        changes[k] = _deep_merge(cur, v) if isinstance(cur, dict) and isinstance(v, dict) else v
+    return replace(policy, **changes)
+
+BUILTIN_VARIANTS: Dict[str, PolicyVariant] = {
+    "baseline": PolicyVariant("baseline"),
+    "apply_on_change": PolicyVariant("apply_on_change", apply_on_change=True),
+    "ris_eager": PolicyVariant("ris_eager", optimizer=OptimizerPolicy(ris_min_uncertainty=0.45, ris_max_cost_weight=0.3)),
+    "suspect_lenient": PolicyVariant(
+        "suspect_lenient",
+        middle=MiddlePolicy(suspect_severity=0.75),
+        optimizer=OptimizerPolicy(suspect_slice="eMBB", suspect_ai_ran_mode="Baseline"),
+    ),
+}
+
+KOI_KEYS = ("mission_success", "operational_cost", "stability")
+KPI_KEYS = ("latency_ms", "loss_pct", "jitter_ms")
+
+@dataclass
+class VariantStats:
+    events: int = 0
+    api_calls: int = 0
+    energy: float = 0.0
+    ops: float = 0.0
+    budget_met: int = 0
+    contexts: Dict[str, int] = field(default_factory=dict)
+    koi: Dict[str, QuantileSketch] = field(default_factory=lambda: {k: QuantileSketch() for k in KOI_KEYS})
+    kpi: Dict[str, QuantileSketch] = field(default_factory=lambda: {k: QuantileSketch() for k in KPI_KEYS})
+
+    def merge(self, other: "VariantStats") -> None:
+        self.events += other.events
+        self.api_calls += other.api_calls
+        self.energy += other.energy
+        self.ops += other.ops
+        self.budget_met += other.budget_met
+        for k, n in other.contexts.items():
+            self.contexts[k] = self.contexts.get(k, 0) + n
+        for k in KOI_KEYS:
+            self.koi[k].merge(other.koi[k])
+        for k in KPI_KEYS:
+            self.kpi[k].merge(other.kpi[k])
+
+    def report(self) -> Dict[str, Any]:
+        n = max(1, self.events)
+
+        def dist(sk: QuantileSketch) -> Dict[str, float]:
+            return {
+                "mean": round(sk.mean() or 0.0, 2),
+                **{f"p{q}": round(sk.quantile(q / 100.0) or 0.0, 2) for q in (5, 50, 95, 99)},
+            }
+
+        return {
+            "events": self.events,
+            "api_calls": self.api_calls,
+            "api_calls_per_event": round(self.api_calls / n, 3),
+            "energy_total": round(self.energy, 1),
+            "ops_total": round(self.ops, 1),
+            "energy_per_event": round(self.energy / n, 3),
+            "ops_per_event": round(self.ops / n, 3),
+            "latency_budget_met": round(self.budget_met / n, 4),
+            "contexts": dict(sorted(self.contexts.items())),
+            "koi": {k: dist(self.koi[k]) for k in KOI_KEYS},
+            "kpi": {k: dist(self.kpi[k]) for k in KPI_KEYS},
+        }
+
+_GENERATORS = (gen_nurse_note, gen_wearable_spike, gen_ambulance_app, gen_network_degradation)
+
+def chunk_seed(seed: int, idx: int) -> int:
+    # 생성/기록/재생이 모두 chunk index 기준으로 같은 seed를 쓰도록 한 곳에서 계산
+    return seed * 1_000_003 + idx
+
+def generate_events(n: int, seed: int, patients: Tuple[str, ...] = ("A", "B", "C")) -> List[StandardEvent]:
+    rng_state = random.getstate()
+    random.seed(seed)
+    try:
+        return [normalize(random.choice(_GENERATORS)(random.choice(patients))) for _ in range(n)]
+    finally:
+        random.setstate(rng_state)
+
+def load_events(path: str) -> Iterator[StandardEvent]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield StandardEvent(**json.loads(line))
+
+def simulate(events: List[StandardEvent], variant: PolicyVariant, seed: int) -> VariantStats:
+    """
+    back.execute 의미 그대로 telemetry를 시뮬레이션(API sleep 없음).
+    이벤트마다 (seed, 이벤트 index)로 난수열을 다시 시작하므로, 정책에 따라 소비하는 난수 개수가
+    달라도(예: RIS OFF일 때만 coverage를 뽑음) 같은 이벤트는 variant 간 같은 noise를 씀(common random numbers).
+    """
+    st = VariantStats()
+    koi_sk = [st.koi[k] for k in KOI_KEYS]
+    lat_sk, loss_sk, jit_sk = (st.kpi[k] for k in KPI_KEYS)
+    last_applied: Dict[str, Any] = {}
+    for i, ev in enumerate(events):
+        random.seed(seed << 32 | i)
+        intent = make_intent(ev, variant.middle)
+        c = ml_generate_constraints(ev, variant.middle)
+        d = decide(intent, c, variant.optimizer)
+
+        if variant.apply_on_change:
+            # pipeline.apply_decision과 같은 3개 payload 기준
+            for path, payload in (
+                ("network", (d.slice_id, c.latency_budget_ms, c.reliability_target)),
+                ("ris", (d.ris_active, d.ris_zone)),
+                ("ai_ran", (d.ai_ran_mode, tuple(sorted(c.penalty_weights.items())))),
+            ):
+                if last_applied.get(path) != payload:
+                    last_applied[path] = payload
+                    st.api_calls += 1
+        else:
+            st.api_calls += 3
+
+        tele = execute(d)
+        koi = koi_from(tele, d, c, intent)
+
+        st.events += 1
+        st.energy += d.expected_cost["energy"]
+        st.ops += d.expected_cost["ops"]
+        if tele.latency_ms <= c.latency_budget_ms:
+            st.budget_met += 1
+        st.contexts[intent.context] = st.contexts.get(intent.context, 0) + 1
+        koi_sk[0].add(koi.mission_success)
+        koi_sk[1].add(koi.operational_cost)
+        koi_sk[2].add(koi.stability)
+        lat_sk.add(tele.latency_ms)
+        loss_sk.add(tele.loss_pct)
+        jit_sk.add(tele.jitter_ms)
+    return st
+
+def _run_chunk(args: Tuple[int, int, Optional[List[Dict[str, Any]]], int, List[PolicyVariant]]) -> Dict[str, VariantStats]:
+    # 워커: chunk를 한 번만 만들고(또는 받아서) 모든 variant에 동일하게 재생
+    idx, n, event_dicts, seed, variants = args
+    cs = chunk_seed(seed, idx)
+    if event_dicts is None:
+        events = generate_events(n, cs)
+    else:
+        events = [StandardEvent(**d) for d in event_dicts]
+    return {v.name: simulate(events, v, cs) for v in variants}
+
+def _chunks(n_events: int, events_file: Optional[str], chunk_size: int) -> Iterator[Tuple[int, Optional[List[Dict[str, Any]]]]]:
+    if events_file is None:
+        for start in range(0, n_events, chunk_size):
+            yield min(chunk_size, n_events - start), None
+        return
+    buf: List[Dict[str, Any]] = []
+    for ev in load_events(events_file):
+        buf.append(ev.to_dict())
+        if len(buf) >= chunk_size:
+            yield len(buf), buf
+            buf = []
+    if buf:
+        yield len(buf), buf
+
+def _merge_parts(totals: Dict[str, VariantStats], futures: Set[Future]) -> None:
+    for fut in futures:
+        for name, stats in fut.result().items():
+            totals[name].merge(stats)
+
+def replay(variants: List[PolicyVariant], n_events: int = 100_000, events_file: Optional[str] = None,
+           workers: Optional[int] = None, seed: int = 7, chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    totals = {v.name: VariantStats() for v in variants}
+    tasks = ((idx, n, dicts, seed, variants) for idx, (n, dicts) in enumerate(_chunks(n_events, events_file, chunk_size)))
+    # 진행 중인 chunk 수를 제한 → 큰 --events-file도 parent 메모리가 chunk 몇 개 분량으로 유지됨
+    workers = workers or os.cpu_count() or 1
+    max_inflight = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        inflight: Set[Future] = set()
+        for task in tasks:
+            inflight.add(pool.submit(_run_chunk, task))
+            if len(inflight) < max_inflight:
+                continue
+            done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+            _merge_parts(totals, done)
+        _merge_parts(totals, inflight)
+    return {
+        "elapsed_sec": round(time.perf_counter() - t0, 2),
+        "variants": {name: st.report() for name, st in totals.items()},
+    }
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="F–M–B offline what-if policy replay")
+    ap.add_argument("--events", type=int, default=100_000, help="생성할 이벤트 수(--events-file 미사용 시)")
+    ap.add_argument("--events-file", help="StandardEvent JSONL(기록된 workload)")
+    ap.add_argument("--record", help="생성한 이벤트를 JSONL로 저장하고 종료")
+    ap.add_argument("--variants", default=",".join(BUILTIN_VARIANTS), help="내장 variant 이름(쉼표 구분)")
+    ap.add_argument("--variants-file", help='JSON: {"name": {"middle": {...}, "optimizer": {...}, "apply_on_change": bool}}')
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    if args.record:
+        with open(args.record, "w", encoding="utf-8") as f:
+            for idx, start in enumerate(range(0, args.events, args.chunk_size)):
+                for ev in generate_events(min(args.chunk_size, args.events - start), chunk_seed(args.seed, idx)):
+                    f.write(json.dumps(ev.to_dict(), ensure_ascii=False) + "\n")
+        print(json.dumps({"recorded": args.events, "path": args.record}))
+        return
+
+    names = [name for name in args.variants.split(",") if name]
+    unknown = [name for name in names if name not in BUILTIN_VARIANTS]
+    if unknown:
+        ap.error(f"unknown variant(s): {', '.join(unknown)} (choose from {', '.join(BUILTIN_VARIANTS)})")
+    variants = [BUILTIN_VARIANTS[name] for name in names]
+    if args.variants_file:
+        try:
+            with open(args.variants_file, encoding="utf-8") as f:
+                variants += [PolicyVariant.from_dict(name, d) for name, d in json.load(f).items()]
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            ap.error(f"--variants-file: {e}")
+    if not variants:
+        ap.error("no variants selected")
+
+    report = replay(variants, n_events=args.events, events_file=args.events_file,
+                    workers=args.workers, seed=args.seed, chunk_size=args.chunk_size)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
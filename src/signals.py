@@ -0,0 +1,131 @@
+from __future__ import annotations
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+# 소스별 시그널 규칙 테이블(데이터 기반): signal code → keywords
+# FMB_SIGNAL_RULES 환경변수로 같은 형태의 JSON 파일을 지정하면 그 규칙을 사용(파일이 바뀌면 hot-reload)
+DEFAULT_SIGNAL_RULES: Dict[str, Dict[str, List[str]]] = {
+    "nurse_note": {
+        "cyanosis_suspect": ["청색증", "푸르"],
+        "dyspnea_suspect": ["호흡", "숨"],
+        "chest_pain_suspect": ["흉통"],
+    },
+    "ambulance_app": {
+        "in_motion_or_transfer": ["Corridor", "ER"],
+    },
+}
+
+class _CompiledSource:
+    """
+    소스별 키워드 → signal code Aho-Corasick automaton(순수 Python).
+    - 컴파일: 키워드 총 길이에 비례(trie 구성 + BFS로 failure link, 출력 집합 전파)
+    - 매칭: 텍스트 한 번 스캔, 문자당 amortized O(1) → 규칙 수와 무관하게 텍스트 길이에 비례
+    - 겹치거나 포함된 키워드도 모두 검출
+    """
+    def __init__(self, code_rules: Dict[str, List[str]]):
+        self.order = {code: i for i, code in enumerate(code_rules)}
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Set[str]] = [set()]
+        for code, kws in code_rules.items():
+            for kw in kws:
+                if not kw:
+                    continue
+                state = 0
+                for ch in kw:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        out.append(set())
+                    state = nxt
+                out[state].add(code)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = fail[state]
+                    while f and ch not in goto[f]:
+                        f = fail[f]
+                    fail[nxt] = goto[f].get(ch, 0)
+                # failure 상태(더 짧은 suffix 키워드)의 출력도 이 상태에서 함께 보고
+                out[nxt] |= out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out: List[Optional[Tuple[str, ...]]] = [tuple(o) if o else None for o in out]
+
+    def extract(self, text: str) -> List[str]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state] is not None:
+                found.update(out[state])
+        return sorted(found, key=self.order.__getitem__)
+
+class SignalExtractor:
+    """
+    ✅ 규칙 테이블을 소스별 Aho-Corasick automaton으로 컴파일해 payload를 한 번만 스캔
+    - extract(source, text) → 규칙 테이블 순서의 signal code 리스트
+    - reload(rules) / maybe_reload() 로 재시작 없이 규칙 교체(컴파일 후 참조만 교체)
+    """
+    def __init__(self, rules: Optional[Dict[str, Dict[str, List[str]]]] = None,
+                 path: Optional[str] = None, check_interval_sec: float = 2.0):
+        self.path = path
+        self.check_interval_sec = check_interval_sec
+        self._mtime = 0.0
+        self._next_check = 0.0
+        # 규칙 파일이 없거나 잘못됐으면 기본 규칙으로 동작
+        self._tables: Dict[str, _CompiledSource] = self.compile(rules or DEFAULT_SIGNAL_RULES)
+        if path:
+            self.maybe_reload(force=True)
+
+    @staticmethod
+    def compile(rules: Dict[str, Dict[str, List[str]]]) -> Dict[str, _CompiledSource]:
+        return {source: _CompiledSource(code_rules) for source, code_rules in rules.items()}
+
+    def reload(self, rules: Dict[str, Dict[str, List[str]]]) -> None:
+        # 전부 컴파일된 뒤에만 참조 교체(실패하면 예외, 기존 규칙 유지)
+        self._tables = self.compile(rules)
+
+    def maybe_reload(self, force: bool = False) -> bool:
+        if not self.path:
+            return False
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+        self._next_check = now + self.check_interval_sec
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return False
+        if not force and mtime == self._mtime:
+            return False
+        # 같은 mtime의 잘못된 파일은 다시 읽지 않음(수정되면 재시도)
+        self._mtime = mtime
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                tables = self.compile(json.load(f))
+        except (OSError, ValueError, TypeError, AttributeError):
+            # 읽을 수 없거나 형태가 잘못된 규칙 파일이면 기존 규칙 유지
+            return False
+        self._tables = tables
+        return True
+
+    def extract(self, source: str, text: str) -> List[str]:
+        self.maybe_reload()
+        table = self._tables.get(source)
+        return table.extract(text) if table else []
+
+SIGNAL_EXTRACTOR = SignalExtractor(path=os.environ.get("FMB_SIGNAL_RULES"))
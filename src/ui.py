@@ -1,14 +1,18 @@
 from __future__ import annotations
+import random
+from collections import deque
 import streamlit as st
-import pandas as pd
 
 from .generators import gen_nurse_note, gen_wearable_spike, gen_ambulance_app, gen_network_degradation
-from .front import normalize, FrontHierMemory
-from .middle import make_intent, ml_generate_constraints
-from .optimizer import decide
-from .api_sim import apply_network, apply_ris, apply_ai_ran
-from .back import execute
-from .metrics import koi_from, effect_mapping
+from .front import FrontHierMemory, FrontEventAggregator
+from .metrics import effect_mapping
+from .analytics import RollingAnalytics
+from .overload import OverloadController
+from .pipeline import drain, phase_of
+
+HISTORY_MAX = 200
+
+# pandas(+NumPy)는 DataFrame을 그리는 탭 안에서만 lazy import (cold start 단축)
 
 def init_session_state():
     if "raw_inbox" not in st.session_state:
@@ -17,6 +21,12 @@ def init_session_state():
         st.session_state.events = []
     if "front_mem" not in st.session_state:
         st.session_state.front_mem = FrontHierMemory(hot_max=25)
+    if "front_agg" not in st.session_state:
+        st.session_state.front_agg = FrontEventAggregator(window_sec=2.0)
+    if "intake_queue" not in st.session_state:
+        st.session_state.intake_queue = deque()
+    if "overload" not in st.session_state:
+        st.session_state.overload = OverloadController()
     if "latest" not in st.session_state:
         st.session_state.latest = {
             "phase": "Normal",
@@ -28,13 +38,15 @@ def init_session_state():
     if "api_calls" not in st.session_state:
         st.session_state.api_calls = []
     if "history" not in st.session_state:
-        st.session_state.history = []  # telemetry + koi history
+        st.session_state.history = []  # telemetry + koi history (최근 HISTORY_MAX건, 장기 집계는 analytics)
+    if "analytics" not in st.session_state:
+        st.session_state.analytics = RollingAnalytics()
     if "effect_cards" not in st.session_state:
         st.session_state.effect_cards = []
 
 def render_top_status_bar():
     latest = st.session_state.latest
-    c1, c2, c3, c4, c5 = st.columns([1.1, 1, 1, 1, 1.8])
+    c1, c2, c3, c4, c5, c6 = st.columns([1.1, 1, 1, 1, 1.8, 1.1])
     with c1:
         st.metric("Phase", latest["phase"])
     with c2:
@@ -46,42 +58,23 @@ def render_top_status_bar():
     with c5:
         koi = latest["koi"]
         st.metric("KOI (Mission/Cost/Stability)", f'{koi["mission_success"]} / {koi["operational_cost"]} / {koi["stability"]}')
-
-def _push_raw_and_process(raw):
-    st.session_state.raw_inbox.insert(0, raw)
-
-    ev = normalize(raw)
-    st.session_state.events.insert(0, ev)
-    st.session_state.front_mem.push(ev)
-
-    intent = make_intent(ev)
-    constraints = ml_generate_constraints(ev)
-    decision = decide(intent, constraints)
-
-    # "API 호출" 연출
-    calls = []
-    calls.append(apply_network({"slice_id": decision.slice_id, "latency_budget_ms": constraints.latency_budget_ms, "reliability": constraints.reliability_target}))
-    calls.append(apply_ris({"active": decision.ris_active, "zone": decision.ris_zone}))
-    calls.append(apply_ai_ran({"mode": decision.ai_ran_mode, "penalty_weights": constraints.penalty_weights}))
-    st.session_state.api_calls = calls
-
-    # Back 실행 & telemetry
-    tele = execute(decision)
-
-    # KOI 점수
-    koi = koi_from(tele, decision, constraints, intent)
-    st.session_state.latest["koi"] = koi.to_dict()
-    st.session_state.latest["active_slice"] = decision.slice_id
-    st.session_state.latest["ris"] = decision.ris_zone if decision.ris_active else "OFF"
-    st.session_state.latest["ai_ran"] = decision.ai_ran_mode
-
-    # Phase
-    if intent.context == "EMERGENCY_CRITICAL":
-        st.session_state.latest["phase"] = "Emergency"
-    elif intent.context == "EMERGENCY_SUSPECT":
-        st.session_state.latest["phase"] = "Alert"
-    else:
-        st.session_state.latest["phase"] = "Normal"
+    with c6:
+        # drain은 동기 실행이라 끝나면 level이 복구됨 → 마지막 intake 처리 중 최고 level을 표시
+        ol = st.session_state.overload.status()
+        last = ol["last_drain"]
+        st.metric(
+            "Degradation (last intake)",
+            f'L{last["peak_level"]} {last["peak_level_name"]}',
+            help=f'shed={last["shed"]} · now L{ol["level"]} {ol["level_name"]} queue={ol["queue_depth"]} stage_ms={ol["stage_ms"]}',
+        )
+
+def _record_event(raw, ev):
+    if st.session_state.overload.per_event_ui():
+        st.session_state.raw_inbox.insert(0, raw)
+        st.session_state.events.insert(0, ev)
+
+def _record_result(res):
+    tele, koi, decision, constraints = res.tele, res.koi, res.decision, res.constraints
 
     # 기록(Results 탭)
     st.session_state.history.insert(0, {
@@ -98,15 +91,42 @@ def _push_raw_and_process(raw):
         "uncertainty": constraints.uncertainty,
         "lat_budget": constraints.latency_budget_ms,
     })
+    del st.session_state.history[HISTORY_MAX:]
+    st.session_state.analytics.ingest(tele, koi, decision)
+
+    if st.session_state.overload.per_event_ui():
+        _update_latest(res)
 
+def _update_latest(res):
+    decision = res.decision
+    st.session_state.api_calls = res.calls
+    st.session_state.latest["koi"] = res.koi.to_dict()
+    st.session_state.latest["active_slice"] = decision.slice_id
+    st.session_state.latest["ris"] = decision.ris_zone if decision.ris_active else "OFF"
+    st.session_state.latest["ai_ran"] = decision.ai_ran_mode
+    st.session_state.latest["phase"] = phase_of(res.intent)
     st.session_state.effect_cards = effect_mapping(decision)
 
-    return raw, ev, intent, constraints, decision, tele, koi
+def _push_raw_and_process(*raws):
+    # 같은 환자의 burst는 Front에서 병합/중복 제거, 과부하면 OverloadController가 단계적으로 degrade
+    st.session_state.intake_queue.extend(raws)
+    results = drain(
+        st.session_state.intake_queue,
+        st.session_state.front_mem,
+        st.session_state.front_agg,
+        st.session_state.overload,
+        on_event=_record_event,
+        on_result=_record_result,
+    )
+    if results:
+        # NO_UI 레벨에서도 burst 마지막 결과는 반영(batch apply된 calls 포함)
+        _update_latest(results[-1])
+    return results
 
 def tab_live_intake():
     st.subheader("Live Intake (Free-form Input → Front Normalize/Embed → Event Bus)")
 
-    b1, b2, b3, b4, b5 = st.columns([1, 1, 1, 1, 2])
+    b1, b2, b3, b4, b5, b6 = st.columns([1, 1, 1, 1, 1, 2])
     with b1:
         if st.button("Generate Nurse Note 🧾"):
             _push_raw_and_process(gen_nurse_note("A"))
@@ -120,6 +140,10 @@ def tab_live_intake():
         if st.button("Generate Network Degradation 📡"):
             _push_raw_and_process(gen_network_degradation("A"))
     with b5:
+        if st.button("Burst ×30 🌊"):
+            gens = [gen_nurse_note, gen_wearable_spike, gen_ambulance_app, gen_network_degradation]
+            _push_raw_and_process(*[random.choice(gens)(random.choice("ABC")) for _ in range(30)])
+    with b6:
         st.info("✅ 차별점: **계층형 메모리를 Back이 아니라 Front에 배치** (real-time triage & retrieval)")
 
     colL, colM, colR = st.columns([1.2, 1.2, 1.4])
@@ -168,10 +192,14 @@ def tab_live_intake():
     with c2:
         st.write("**Warm Summary**")
         st.json(st.session_state.front_mem.warm_summary())
+        st.write("**Burst Aggregation (window/dedupe)**")
+        agg = st.session_state.front_agg.stats()
+        st.metric("compression (in → out)", f'{int(agg["received"])} → {int(agg["forwarded"])}  (x{agg["compression_ratio"]})')
     with c3:
         st.write("**Cold Index (longer-term pointers)**")
         cold = list(st.session_state.front_mem.cold_index)[:10]
         if cold:
+            import pandas as pd
             st.dataframe(pd.DataFrame(cold))
         else:
             st.caption("No index yet.")
@@ -265,6 +293,7 @@ def tab_results_effects():
         st.warning("아직 결과가 없습니다. Live Intake에서 이벤트를 생성하세요.")
         return
 
+    import pandas as pd
     df = pd.DataFrame(st.session_state.history[:30])
 
     c1, c2 = st.columns([1.4, 1])
@@ -288,6 +317,28 @@ def tab_results_effects():
 
     st.divider()
 
+    st.markdown("### Rolling KPI/KOI (Hour / Shift / Day)")
+    windows = {"Last 1h": 3600, "Shift (8h)": 8 * 3600, "Day (24h)": 24 * 3600}
+    w1, w2 = st.columns([1, 1])
+    with w1:
+        window = st.radio("Window", list(windows), horizontal=True)
+    with w2:
+        group_by = st.radio("Group by", ["all", "slice", "ris", "ai_ran"], horizontal=True)
+    analytics = st.session_state.analytics
+    rows = analytics.query(windows[window], group_by=None if group_by == "all" else group_by)
+    if rows:
+        st.dataframe(pd.DataFrame(rows).set_index("group"))
+    else:
+        st.caption("선택한 window에 집계된 결과가 없습니다.")
+    series = pd.DataFrame(analytics.series(windows[window]))
+    if not series.empty:
+        series = series.set_index("t")  # bucket당 한 점(분/시간 단위로 downsample)
+        st.line_chart(series[["latency_ms_p50", "latency_ms_p95", "jitter_ms_p95"]], height=220)
+        st.line_chart(series[["koi_mission_mean", "koi_cost_mean", "koi_stability_mean"]], height=220)
+    st.caption(f"누적 {analytics.total}건 · streaming quantile sketch + tumbling window rollup")
+
+    st.divider()
+
     st.markdown("### Effect Mapping (원인 → 개선효과)")
     cards = st.session_state.effect_cards or []
     cols = st.columns(3)
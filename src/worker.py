@@ -0,0 +1,65 @@
+from __future__ import annotations
+import argparse
+import json
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, List
+
+from . import api_sim
+from .generators import gen_nurse_note, gen_wearable_spike, gen_ambulance_app, gen_network_degradation
+from .schema import RawIngest
+from .front import FrontHierMemory, FrontEventAggregator
+from .overload import OverloadController
+from .pipeline import drain, phase_of
+
+# ✅ headless worker: streamlit/pandas 없이 Front → Middle → Optimizer → API → Back 실행
+GENERATORS = {
+    "nurse_note": gen_nurse_note,
+    "wearable": gen_wearable_spike,
+    "ambulance_app": gen_ambulance_app,
+    "network": gen_network_degradation,
+}
+
+def run(n_events: int, patients: List[str], window_sec: float = 2.0, burst: int = 1) -> Dict[str, object]:
+    mem = FrontHierMemory(hot_max=25)
+    agg = FrontEventAggregator(window_sec=window_sec)
+    ctl = OverloadController()
+    queue: Deque[RawIngest] = deque()
+    phases: Dict[str, int] = {}
+    peak_level = 0
+    t0 = time.perf_counter()
+    done = 0
+    while done < n_events:
+        k = min(burst, n_events - done)
+        queue.extend(random.choice(list(GENERATORS.values()))(random.choice(patients)) for _ in range(k))
+        done += k
+        ctl.observe_queue(len(queue))
+        peak_level = max(peak_level, ctl.level)
+        for res in drain(queue, mem, agg, ctl):
+            phase = phase_of(res.intent)
+            phases[phase] = phases.get(phase, 0) + 1
+    return {
+        "events": n_events,
+        "elapsed_sec": round(time.perf_counter() - t0, 3),
+        "phases": phases,
+        "aggregation": agg.stats(),
+        "overload": {**ctl.status(), "peak_level": peak_level},
+        "warm_summary": mem.warm_summary(),
+    }
+
+def main(argv: List[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="F–M–B headless pipeline worker")
+    ap.add_argument("--events", type=int, default=100)
+    ap.add_argument("--patients", default="A,B,C")
+    ap.add_argument("--window-sec", type=float, default=2.0)
+    ap.add_argument("--burst", type=int, default=1, help="한 번에 intake queue에 쌓이는 이벤트 수")
+    ap.add_argument("--api-delay-scale", type=float, default=0.0, help="API 적용 sleep 배율(1.0 = UI와 동일)")
+    args = ap.parse_args(argv)
+
+    api_sim.DELAY_SCALE = args.api_delay_scale
+    summary = run(args.events, args.patients.split(","), window_sec=args.window_sec, burst=args.burst)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
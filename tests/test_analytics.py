@@ -0,0 +1,64 @@
+import random
+
+from src.analytics import QuantileSketch, RollingAnalytics
+from src.back import Telemetry
+from src.metrics import KOI
+from src.optimizer import Decision
+
+def _exact(sorted_xs, q):
+    return sorted_xs[int(q * (len(sorted_xs) - 1))]
+
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(3)
+    xs = [rng.lognormvariate(3, 0.8) for _ in range(20000)]
+    sk = QuantileSketch(rel_acc=0.01)
+    for x in xs:
+        sk.add(x)
+    xs.sort()
+    for q in (0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 1.0):
+        exact = _exact(xs, q)
+        assert abs(sk.quantile(q) - exact) <= 0.01 * exact + 1e-9
+
+def test_sketch_merge_and_clamp_to_observed_range():
+    a, b = QuantileSketch(), QuantileSketch()
+    for x in (0, 0, 50):
+        a.add(x)
+    for x in (100, 100, 100):
+        b.add(x)
+    a.merge(b)
+    assert a.count == 6 and a.quantile(0.0) == 0.0
+    assert a.quantile(0.99) == 100  # 버킷 대표값이 관측 max를 넘지 않음
+    assert abs(a.quantile(0.5) - 50) <= 0.5
+    assert QuantileSketch().quantile(0.5) is None
+
+def _ingest(ra, ts, latency, slice_id="URLLC"):
+    tele = Telemetry(latency_ms=latency, loss_pct=1.0, jitter_ms=5.0, coverage_ok=True)
+    koi = KOI(mission_success=80, operational_cost=70, stability=60)
+    d = Decision(slice_id=slice_id, ris_zone="OFF", ris_active=False, ai_ran_mode="Assist",
+                 expected_gain={}, expected_cost={})
+    ra.ingest(tele, koi, d, ts=ts)
+
+def test_window_query_groups_and_eviction():
+    t = [0.0]
+    ra = RollingAnalytics(tiers=((60, 3), (600, 2)), clock=lambda: t[0])
+    for i in range(10):
+        _ingest(ra, ts=i * 30.0, latency=10.0 + i, slice_id="URLLC" if i % 2 else "eMBB")
+    t[0] = 9 * 30.0
+    # 분 tier는 최근 3 bucket(= 180초)만 보관
+    assert sum(r["count"] for r in ra.query(180)) == 6
+    assert len(ra.series(180)) == 3
+    # 0·60초 bucket은 제거됐으므로 그 시점 기준으로 물어도 비어 있음
+    assert ra.query(180, now=90.0) == []
+    by_slice = {r["group"]: r["count"] for r in ra.query(180, group_by="slice")}
+    assert by_slice == {"URLLC": 3, "eMBB": 3}
+    # 더 긴 window는 상위 tier 사용 → 전체 10건
+    assert sum(r["count"] for r in ra.query(1200)) == 10
+    assert ra.total == 10
+
+def test_idle_window_returns_no_rows():
+    t = [0.0]
+    ra = RollingAnalytics(clock=lambda: t[0])
+    _ingest(ra, ts=0.0, latency=10.0)
+    t[0] = 2 * 3600.0
+    assert ra.query(3600) == []
+    assert ra.series(3600) == []
@@ -0,0 +1,60 @@
+from src.front import FrontEventAggregator
+from src.schema import StandardEvent
+
+def _ev(signal, severity, patient="A", source="nurse_note"):
+    return StandardEvent(
+        event_id="evt", source=source, patient_id=patient, event_time="t", ingest_time="t",
+        signal=list(signal), severity=severity, confidence=0.8, embedding=[],
+        payload_hint={}, ttl_sec=15 if severity >= 0.7 else 60,
+    )
+
+def _agg(window_sec=2.0):
+    t = [0.0]
+    return FrontEventAggregator(window_sec=window_sec, clock=lambda: t[0]), t
+
+def test_burst_merges_and_dedupes():
+    agg, t = _agg()
+    assert agg.offer(_ev(["tachycardia", "spo2_drop"], 0.75)) is not None
+    for _ in range(10):
+        t[0] += 0.1
+        assert agg.offer(_ev(["tachycardia", "spo2_drop"], 0.75)) is None
+    t[0] += 0.1
+    merged = agg.offer(_ev(["chest_pain_suspect"], 0.82))
+    assert merged.signal == ["tachycardia", "spo2_drop", "chest_pain_suspect"]
+    assert merged.severity == 0.82
+    assert agg.stats()["received"] == 12 and agg.stats()["forwarded"] == 2
+    assert agg.compression_ratio() == 6.0
+
+def test_window_is_anchored_and_expires_under_constant_reports():
+    agg, t = _agg(window_sec=2.0)
+    forwarded = 0
+    for _ in range(60):
+        if agg.offer(_ev(["chest_pain_suspect"], 0.82)) is not None:
+            forwarded += 1
+        t[0] += 1.0
+    # 1초마다 같은 note가 와도 2초마다 window가 닫히고 새로 열림
+    assert forwarded == 30
+    assert agg.stats()["open_windows"] == 1
+
+def test_deescalation_is_forwarded_after_window_closes():
+    agg, t = _agg(window_sec=2.0)
+    assert agg.offer(_ev(["chest_pain_suspect"], 0.82)).severity == 0.82
+    t[0] += 1.0
+    assert agg.offer(_ev(["normal_observation"], 0.2)) is None
+    t[0] += 1.5
+    recovered = agg.offer(_ev(["normal_observation"], 0.2))
+    assert recovered is not None and recovered.severity == 0.2
+
+def test_flush_closes_only_expired_windows_in_open_order():
+    agg, t = _agg(window_sec=2.0)
+    agg.offer(_ev(["tachycardia"], 0.75, patient="A"))
+    t[0] += 1.0
+    agg.offer(_ev(["tachycardia"], 0.75, patient="B"))
+    t[0] += 1.5
+    assert agg.flush() == 1
+    # A는 닫혀 새 window로 전달, B는 아직 열려 있어 중복 제거
+    assert agg.offer(_ev(["tachycardia"], 0.75, patient="B")) is None
+    assert agg.offer(_ev(["tachycardia"], 0.75, patient="A")) is not None
+    t[0] += 1.0
+    assert agg.flush() == 1
+    assert agg.stats()["open_windows"] == 1 and agg.stats()["closed_windows"] == 2
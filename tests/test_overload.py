@@ -0,0 +1,58 @@
+from src.overload import (
+    FULL, NO_EMBED, SAMPLE_ROUTINE, BATCH_API, NO_UI, OverloadConfig, OverloadController,
+)
+
+def _steady_event(ctl, depth):
+    # UI 기본 지연과 비슷한 stage 측정값(api ≈ 660ms, 예산 1000ms 이내)
+    ctl.observe_queue(depth)
+    ctl.observe_stage("front", 1.0)
+    ctl.observe_stage("middle", 0.2)
+    ctl.observe_stage("api", 660.0)
+    ctl.observe_stage("back", 0.2)
+
+def test_burst_then_idle_returns_to_full():
+    ctl = OverloadController()
+    for depth in range(30, 0, -1):
+        _steady_event(ctl, depth)
+        if depth == 30:
+            assert ctl.level == BATCH_API
+    ctl.observe_queue(0)
+    assert ctl.level == FULL
+    for _ in range(50):
+        _steady_event(ctl, 1)
+        ctl.observe_queue(0)
+    assert ctl.level == FULL
+    assert ctl.embed_enabled()
+
+def test_queue_hysteresis_steps_down_gradually():
+    ctl = OverloadController()
+    levels = []
+    for depth in (2, 5, 9, 20, 40, 10, 6, 3, 0):
+        ctl.observe_queue(depth)
+        levels.append(ctl.level)
+    assert levels == [FULL, NO_EMBED, SAMPLE_ROUTINE, BATCH_API, NO_UI, BATCH_API, SAMPLE_ROUTINE, NO_EMBED, FULL]
+
+def test_slow_stage_raises_level_and_idle_decay_recovers():
+    ctl = OverloadController()
+    ctl.observe_stage("api", 2500.0)
+    assert ctl.level == NO_EMBED
+    ctl.observe_queue(0)
+    ctl.observe_queue(0)
+    assert ctl.stage_ms["api"] < 1000.0
+    assert ctl.level == FULL
+
+def test_routine_sampling_keeps_emergencies():
+    ctl = OverloadController()
+    ctl.observe_queue(40)
+    assert [ctl.admit("NORMAL_MONITORING") for _ in range(6)] == [True, False, False, False, False, True]
+    assert all(ctl.admit("EMERGENCY_CRITICAL") for _ in range(10))
+    assert ctl.batch_api("NORMAL_MONITORING") and not ctl.batch_api("EMERGENCY_SUSPECT")
+    assert not ctl.per_event_ui()
+    assert ctl.status()["shed"] == 4
+
+def test_sample_every_one_keeps_all_routine_events():
+    ctl = OverloadController(OverloadConfig(routine_sample_every=1))
+    ctl.observe_queue(40)
+    assert ctl.level >= SAMPLE_ROUTINE
+    assert all(ctl.admit("NORMAL_MONITORING") for _ in range(10))
+    assert ctl.shed == 0
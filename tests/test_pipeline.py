@@ -0,0 +1,64 @@
+from collections import deque
+
+import pytest
+
+from src import api_sim
+from src.front import FrontEventAggregator, FrontHierMemory
+from src.overload import BATCH_API, FULL, NO_EMBED, OverloadConfig, OverloadController
+from src.pipeline import drain
+from src.schema import RawIngest
+
+@pytest.fixture(autouse=True)
+def _no_api_delay(monkeypatch):
+    monkeypatch.setattr(api_sim, "DELAY_SCALE", 0.0)
+
+def _raw(patient, emergency):
+    # ambulance_app: fall_detected → EMERGENCY_CRITICAL, 아니면 NORMAL_MONITORING
+    payload = {"patient": patient, "fall_detected": emergency, "location": "Ward_3"}
+    return RawIngest(raw_id=f"raw-{patient}", source="ambulance_app", ingest_time="t", payload=payload)
+
+def _ctl(level, **kw):
+    # 남은 queue depth가 1 이상이면 항상 주어진 level이 되도록 임계값 구성
+    thresholds = tuple(1 if i < level else 10_000 for i in range(4))
+    return OverloadController(OverloadConfig(queue_thresholds=thresholds, **kw))
+
+def _drain(raws, ctl, on_event=None):
+    return drain(deque(raws), FrontHierMemory(), FrontEventAggregator(), ctl, on_event=on_event)
+
+def test_batched_routine_decisions_apply_only_the_last_one():
+    # 샘플링은 끄고(every=1) batch apply만 확인
+    results = _drain([_raw(p, False) for p in "ABC"], _ctl(BATCH_API, routine_sample_every=1))
+    assert [r.intent.context for r in results] == ["NORMAL_MONITORING"] * 3
+    assert [len(r.calls) for r in results] == [0, 0, 3]
+
+def test_newer_emergency_apply_drops_deferred_routine_decision():
+    results = _drain([_raw("A", False), _raw("B", True)], _ctl(BATCH_API))
+    routine, emergency = results
+    assert emergency.intent.context == "EMERGENCY_CRITICAL"
+    assert len(emergency.calls) == 3
+    # 응급 설정이 더 최신이므로 밀린 routine 결정은 적용하지 않음
+    assert routine.calls == []
+
+def test_emergencies_are_never_shed_or_deferred():
+    ctl = _ctl(BATCH_API, routine_sample_every=1000)
+    raws = [_raw(f"E{i}", True) for i in range(5)] + [_raw(f"R{i}", False) for i in range(5)]
+    results = _drain(raws, ctl)
+    emergencies = [r for r in results if r.intent.context.startswith("EMERGENCY")]
+    routines = [r for r in results if not r.intent.context.startswith("EMERGENCY")]
+    assert len(emergencies) == 5 and all(len(r.calls) == 3 for r in emergencies)
+    assert len(routines) == 1
+    assert ctl.last_drain["shed"] == 4
+
+def test_embedding_skipped_under_no_embed_only():
+    seen = []
+    _drain([_raw("A", False)], _ctl(NO_EMBED), on_event=lambda raw, ev: seen.append(ev.embedding))
+    _drain([_raw("A", False)], _ctl(FULL), on_event=lambda raw, ev: seen.append(ev.embedding))
+    assert seen[0] == [] and len(seen[1]) == 8
+
+def test_last_drain_keeps_peak_level_after_recovery():
+    ctl = OverloadController()
+    results = _drain([_raw(f"P{i}", False) for i in range(30)], ctl)
+    assert len(results) < 30
+    assert ctl.level == FULL
+    assert ctl.last_drain["peak_level"] == BATCH_API
+    assert ctl.status()["last_drain"]["peak_level_name"] == "BATCH_API"
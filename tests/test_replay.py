@@ -0,0 +1,73 @@
+import pytest
+
+from src.middle import MiddlePolicy
+from src.replay import BUILTIN_VARIANTS, PolicyVariant, generate_events, main, replay, simulate
+
+def test_recorded_stream_replays_identically_to_generated(tmp_path, capsys):
+    path = str(tmp_path / "events.jsonl")
+    main(["--record", path, "--events", "900", "--chunk-size", "300", "--seed", "11"])
+    capsys.readouterr()
+    variants = [BUILTIN_VARIANTS["baseline"]]
+    generated = replay(variants, n_events=900, workers=1, seed=11, chunk_size=300)
+    recorded = replay(variants, events_file=path, workers=1, seed=11, chunk_size=300)
+    assert recorded["variants"] == generated["variants"]
+
+def test_bounded_submission_covers_every_chunk():
+    report = replay([BUILTIN_VARIANTS["baseline"]], n_events=1050, workers=1, chunk_size=100)
+    assert report["variants"]["baseline"]["events"] == 1050
+
+def test_apply_on_change_counts_fewer_api_calls():
+    events = generate_events(500, seed=3)
+    base = simulate(events, BUILTIN_VARIANTS["baseline"], seed=3)
+    lazy = simulate(events, BUILTIN_VARIANTS["apply_on_change"], seed=3)
+    assert base.api_calls == 3 * 500
+    assert lazy.api_calls < base.api_calls
+    # 같은 seed → telemetry/KOI는 동일, API 호출 수만 다름
+    assert lazy.energy == base.energy and lazy.budget_met == base.budget_met
+
+def test_variant_override_merges_per_context_dicts():
+    v = PolicyVariant.from_dict("tight", {
+        "middle": {"latency_budget_ms": {"NORMAL_MONITORING": 30}, "penalty_weights": {"EMERGENCY_SUSPECT": {"cost": 0.2}}},
+        "optimizer": {"ris_min_uncertainty": 0.5},
+    })
+    defaults = MiddlePolicy()
+    assert v.middle.latency_budget_ms == {**defaults.latency_budget_ms, "NORMAL_MONITORING": 30}
+    assert v.middle.penalty_weights["EMERGENCY_SUSPECT"] == {"latency": 0.45, "loss": 0.30, "cost": 0.2}
+    assert v.optimizer.ris_min_uncertainty == 0.5
+    # 기본 정책 객체는 변경되지 않음
+    assert defaults.latency_budget_ms["NORMAL_MONITORING"] == 40
+    simulate(generate_events(50, seed=1), v, seed=1)
+
+def test_unknown_policy_field_is_rejected():
+    with pytest.raises(ValueError, match="unknown field"):
+        PolicyVariant.from_dict("bad", {"middle": {"no_such_threshold": 1}})
+
+def test_unknown_variant_name_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--variants", "baseline,nope", "--events", "10"])
+    assert exc.value.code == 2
+    assert "unknown variant(s): nope" in capsys.readouterr().err
+
+def test_variants_with_different_ris_rules_share_noise_per_event(monkeypatch):
+    import random
+    import src.replay as replay_mod
+
+    real = replay_mod.execute
+
+    def spy(log):
+        def wrapped(decision):
+            # execute 진입 시점의 난수 상태 = 이 이벤트의 telemetry noise 원천
+            log.append((random.getstate(), decision.ris_active))
+            return real(decision)
+        return wrapped
+
+    events = generate_events(400, seed=2)
+    base_log, eager_log = [], []
+    monkeypatch.setattr(replay_mod, "execute", spy(base_log))
+    simulate(events, BUILTIN_VARIANTS["baseline"], seed=2)
+    monkeypatch.setattr(replay_mod, "execute", spy(eager_log))
+    simulate(events, BUILTIN_VARIANTS["ris_eager"], seed=2)
+
+    # RIS 결정이 실제로 갈리는 이벤트가 있어야 의미 있는 비교
+    assert any(b[1] != e[1] for b, e in zip(base_log, eager_log))
+    assert [b[0] for b in base_log] == [e[0] for e in eager_log]
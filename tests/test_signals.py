@@ -0,0 +1,73 @@
+import json
+import os
+import random
+import time
+
+from src.signals import SignalExtractor
+
+def test_overlapping_and_nested_keywords_all_match():
+    ex = SignalExtractor({"n": {"a": ["ab"], "b": ["bc"]}})
+    assert ex.extract("n", "abc") == ["a", "b"]
+    ex = SignalExtractor({"n": {"a": ["호흡곤"], "b": ["곤란"], "c": ["호흡"]}})
+    assert ex.extract("n", "호흡곤란 호소") == ["a", "b", "c"]
+
+def test_results_follow_rule_order_and_unknown_source_is_empty():
+    ex = SignalExtractor({"n": {"x": ["흉통"], "y": ["숨"]}})
+    assert ex.extract("n", "숨 가쁨, 흉통") == ["x", "y"]
+    assert ex.extract("other", "흉통") == []
+
+def test_default_rules_match_nurse_note():
+    ex = SignalExtractor()
+    assert ex.extract("nurse_note", "청색증 의심. 호흡 곤란") == ["cyanosis_suspect", "dyspnea_suspect"]
+
+def _korean_keywords(rng, n):
+    # 첫 글자가 제각각인 2~4음절 키워드(공통 접두어 없음)
+    return ["".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 4))) for _ in range(n)]
+
+def test_large_rule_table_with_varied_keywords():
+    rng = random.Random(5)
+    kws = _korean_keywords(rng, 5000)
+    ex = SignalExtractor({"n": {f"s{i}": [kw] for i, kw in enumerate(kws)}})
+    text = f"관찰 중 {kws[4999]} 그리고 {kws[7]} 호소"
+    assert ex.extract("n", text) == ["s7", "s4999"]
+
+def _best_extract_time(ex, text, repeat=200):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        ex.extract("n", text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def test_per_message_cost_is_flat_in_rule_count():
+    rng = random.Random(9)
+    note = " ".join(_korean_keywords(rng, 60))
+    small = SignalExtractor({"n": {f"s{i}": [kw] for i, kw in enumerate(_korean_keywords(rng, 10))}})
+    large = SignalExtractor({"n": {f"s{i}": [kw] for i, kw in enumerate(_korean_keywords(rng, 5000))}})
+    # 규칙 500배 증가에도 메시지당 비용은 텍스트 길이에 비례(넉넉하게 4배 이내)
+    assert _best_extract_time(large, note) < 4 * _best_extract_time(small, note)
+
+def _write(path, rules, mtime):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rules, f)
+    os.utime(path, (mtime, mtime))
+
+def test_hot_reload_and_bad_rules_keep_previous_tables(tmp_path):
+    path = str(tmp_path / "rules.json")
+    _write(path, {"n": {"q": ["hi"]}}, 1_000)
+    ex = SignalExtractor(path=path, check_interval_sec=0)
+    assert ex.extract("n", "hi there") == ["q"]
+
+    _write(path, {"n": {"z": ["there"]}}, 2_000)
+    assert ex.extract("n", "hi there") == ["z"]
+
+    # JSON으로는 유효하지만 형태가 잘못된 규칙 → 예외 없이 기존 규칙 유지
+    _write(path, {"n": ["bad"]}, 3_000)
+    assert ex.extract("n", "hi there") == ["z"]
+    assert ex.extract("n", "hi there") == ["z"]
+
+def test_bad_rules_file_at_startup_falls_back_to_defaults(tmp_path):
+    path = str(tmp_path / "rules.json")
+    _write(path, {"nurse_note": ["bad"]}, 1_000)
+    ex = SignalExtractor(path=path, check_interval_sec=0)
+    assert ex.extract("nurse_note", "흉통 호소") == ["chest_pain_suspect"]